@@ -1,12 +1,15 @@
 import os
 import hmac
+import functools
 import subprocess
 import logging
 import signal
+import threading
 import re
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import shlex
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
-from datetime import datetime, timezone
 
 try:
     from dotenv import load_dotenv
@@ -14,7 +17,20 @@ try:
 except ImportError:
     pass
 
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj).encode()
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
 CONTENT_TYPE_JSON = 'application/json'
+CONTENT_TYPE_TEXT = 'text/plain; charset=utf-8'
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,154 +41,323 @@ logger = logging.getLogger(__name__)
 DEPLOY_WEBHOOK_SECRET = os.getenv('DEPLOY_WEBHOOK_SECRET', '')
 PORT = int(os.getenv('PORT', '9000'))
 COMMAND_TIMEOUT = int(os.getenv('COMMAND_TIMEOUT', '600'))
+MAX_BODY = int(os.getenv('MAX_BODY', '65536'))
+DEFAULT_LOG_DIR = '/var/log/deploy'
+FALLBACK_LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+
+def _default_log_dir():
+    if os.path.isdir(DEFAULT_LOG_DIR):
+        writable = os.access(DEFAULT_LOG_DIR, os.W_OK | os.X_OK)
+    else:
+        writable = os.access(os.path.dirname(DEFAULT_LOG_DIR), os.W_OK | os.X_OK)
+    return DEFAULT_LOG_DIR if writable else FALLBACK_LOG_DIR
+
+DEPLOY_LOG_DIR = os.getenv('DEPLOY_LOG_DIR') or _default_log_dir()
+
+KEEPALIVE_TIMEOUT = 60
+BODY_CHUNK_SIZE = 16384
+LOG_TAIL_SIZE = 4096
+
+_deploy_lock = threading.Lock()
+_health_body = [0, b'']
 
 if not DEPLOY_WEBHOOK_SECRET:
     raise ValueError("DEPLOY_WEBHOOK_SECRET environment variable is required")
 
-ALLOWED_COMMANDS = [
-    r'^cd\s+',
-    r'^git\s+',
-    r'^docker\s+',
-]
+_EXPECTED_TOKEN = DEPLOY_WEBHOOK_SECRET.encode()
+_EXPECTED_TOKEN_LEN = len(_EXPECTED_TOKEN)
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern, flags=re.IGNORECASE):
+    return re.compile(pattern, flags)
+
+def _has_top_level_alternation(pattern):
+    depth = 0
+    in_class = False
+    chars = iter(pattern)
+    for char in chars:
+        if char == '\\':
+            next(chars, None)
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+    return False
+
+def _leading_literal(pattern):
+    if _has_top_level_alternation(pattern):
+        return None
+    pattern = pattern.removeprefix(r'\b')
+    if pattern[:1] == '\\':
+        lead = pattern[:2]
+        if len(lead) < 2 or lead[1] not in '|>;&':
+            return None
+    else:
+        lead = pattern[:1]
+        if not lead or not (lead.isascii() and lead.isalnum() or lead in '>;&'):
+            return None
+    if pattern[len(lead):len(lead) + 1] in ('?', '*', '{'):
+        return None
+    return lead
+
+def _compile_alternation(patterns):
+    alternation = '|'.join(f'(?:{p})' for p in patterns)
+    leads = {_leading_literal(p) for p in patterns}
+    if None not in leads:
+        alternation = f"(?=[{''.join(sorted(leads))}])(?:{alternation})"
+    return _compile(alternation.encode(), re.IGNORECASE | re.ASCII)
+
+_ALLOWED_VERBS = frozenset({'cd', 'git', 'docker'})
 
 BLOCKED_PATTERNS = [
-    r'\brm\s+-rf',
-    r'\brm\s+-r\s+',
-    r'\brm\s+',
-    r'\bdelete\s+',
-    r'\bformat\s+',
-    r'\bdd\s+',
-    r'\bmkfs\s+',
-    r'\b>.*/dev/',
-    r'\|\s*sh\s*$',
-    r'\|\s*bash\s*$',
-    r';\s*rm\s+',
-    r'&&\s*rm\s+',
-    r'\|\s*rm\s+',
+    r'\brm\s{1,8}-rf',
+    r'\brm\s{1,8}-r\s',
+    r'\brm\s',
+    r'\bdelete\s',
+    r'\bformat\s',
+    r'\bdd\s',
+    r'\bmkfs\s',
+    r'\b>>?[^\n]{0,256}/dev/',
+    r'\|[ \t]{0,8}sh[ \t]{0,8}$',
+    r'\|[ \t]{0,8}bash[ \t]{0,8}$',
+    r';[ \t]{0,8}rm\s',
+    r'&&[ \t]{0,8}rm\s',
+    r'\|[ \t]{0,8}rm\s',
 ]
 
+_BLOCKED_RE = _compile_alternation(BLOCKED_PATTERNS)
+
+_SPLIT_RE = re.compile(r'(?<![ \t\r\n])[ \t\r\n]*(?:&&|;)(?:[ \t\r\n]*(?:&&|;))*[ \t\r\n]*')
+_ARG_SPLIT_RE = re.compile(r'[ \t\r\n]+')
+
+_UNSAFE_LOG_ID_CHARS = re.compile(r'[^A-Za-z0-9_-]')
+_LOG_ID_RE = re.compile(r'[A-Za-z0-9_-]{1,128}')
+
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+
+_ERR_UNAUTHORIZED = b'{"error": "Unauthorized"}'
+_ERR_INVALID_TOKEN = b'{"error": "Invalid token"}'
+_ERR_MISSING_COMMAND = b'{"error": "Missing command in request"}'
+_ERR_INVALID_JSON = b'{"error": "Invalid JSON"}'
+_ERR_INTERNAL = b'{"error": "Internal server error"}'
+_ERR_PAYLOAD_TOO_LARGE = b'{"error": "Payload too large"}'
+_ERR_LENGTH_REQUIRED = b'{"error": "Content-Length required"}'
+_ERR_INVALID_CONTENT_LENGTH = b'{"error": "Invalid Content-Length"}'
+_ERR_NOT_FOUND = b'{"error": "Not found"}'
+_ERR_LOG_NOT_FOUND = b'{"error": "Log not found"}'
+
+def health_body():
+    now = int(time.time())
+    if now != _health_body[0]:
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)).encode()
+        _health_body[:] = [now, _HEALTH_PREFIX + timestamp + _HEALTH_SUFFIX]
+    return _health_body[1]
+
+def split_args(cmd):
+    if '"' in cmd or "'" in cmd or '\\' in cmd:
+        return shlex.split(cmd)
+    return [arg for arg in _ARG_SPLIT_RE.split(cmd) if arg]
+
+def log_path(log_id):
+    return os.path.join(DEPLOY_LOG_DIR, f'{log_id}.log')
+
 class DeploymentHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEPALIVE_TIMEOUT
+
     def log_message(self, format_str, *args):
-        client_ip = self.client_address[0]
-        try:
-            if args:
-                message = format_str % args
-            else:
-                message = format_str
-            logger.info(f"{client_ip} - {message}")
-        except (TypeError, ValueError):
-            logger.info(f"{client_ip} - {format_str}")
+        logger.info("%s - " + format_str, self.client_address[0], *args)
+
+    def respond(self, code, body, content_type=CONTENT_TYPE_JSON):
+        self.wfile.write(self.response_head(code, content_type, len(body)) + body)
+
+    def response_head(self, code, content_type, content_length):
+        self.log_request(code, content_length)
+        return (
+            f'{self.protocol_version} {code} {self.responses[code][0]}\r\n'
+            f'Date: {self.date_time_string()}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Length: {content_length}\r\n'
+            f'Connection: {"close" if self.close_connection else "keep-alive"}\r\n'
+            '\r\n'
+        ).encode('latin-1')
 
     def do_GET(self):
+        if 'Transfer-Encoding' in self.headers or self.content_length() != 0:
+            self.close_connection = True
+        
         if self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-Type', CONTENT_TYPE_JSON)
-            self.end_headers()
-            self.wfile.write(json.dumps({'status': 'healthy', 'timestamp': datetime.now(timezone.utc).isoformat()}).encode())
+            self.respond(200, health_body())
             return
         
-        self.send_response(404)
-        self.end_headers()
+        if self.path.startswith('/logs/'):
+            self.handle_logs(self.path[len('/logs/'):])
+            return
+        
+        self.respond(404, _ERR_NOT_FOUND)
+
+    def handle_logs(self, log_id):
+        if not self.authorize():
+            return
+        
+        if not _LOG_ID_RE.fullmatch(log_id):
+            self.respond(404, _ERR_LOG_NOT_FOUND)
+            return
+        
+        try:
+            log_file = open(log_path(log_id), 'rb')
+        except FileNotFoundError:
+            self.respond(404, _ERR_LOG_NOT_FOUND)
+            return
+        
+        with log_file:
+            size = os.fstat(log_file.fileno()).st_size
+            self.wfile.write(self.response_head(200, CONTENT_TYPE_TEXT, size))
+            self.connection.sendfile(log_file, 0, size)
 
     def do_POST(self):
         if self.path == '/deploy':
             self.handle_deploy()
         else:
-            self.send_response(404)
-            self.end_headers()
+            self.close_connection = True
+            self.respond(404, _ERR_NOT_FOUND)
 
     def handle_deploy(self):
         client_ip = self.client_address[0]
         
-        auth_header = self.headers.get('Authorization', '')
-        if not auth_header.startswith('Bearer '):
-            logger.warning(f"{client_ip} - Missing or invalid Authorization header")
-            self.send_response(401)
-            self.send_header('Content-Type', CONTENT_TYPE_JSON)
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': 'Unauthorized'}).encode())
+        if 'Transfer-Encoding' in self.headers:
+            logger.warning("%s - Transfer-Encoding not supported", client_ip)
+            self.close_connection = True
+            self.respond(411, _ERR_LENGTH_REQUIRED)
             return
         
-        token = auth_header[7:]
+        content_length = self.content_length()
+        if content_length is None:
+            logger.warning("%s - Invalid Content-Length: %r", client_ip, self.headers.get_all('Content-Length'))
+            self.close_connection = True
+            self.respond(400, _ERR_INVALID_CONTENT_LENGTH)
+            return
         
-        if not self.validate_token(token):
-            logger.warning(f"{client_ip} - Invalid token")
-            self.send_response(401)
-            self.send_header('Content-Type', CONTENT_TYPE_JSON)
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': 'Invalid token'}).encode())
+        if content_length > MAX_BODY:
+            logger.warning("%s - Payload too large: %s bytes", client_ip, content_length)
+            self.close_connection = True
+            self.respond(413, _ERR_PAYLOAD_TOO_LARGE)
+            return
+        
+        if not self.authorize(content_length):
             return
         
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length)
+            body = self.read_body(content_length)
             payload = json.loads(body.decode('utf-8')) if content_length > 0 else {}
             commit = payload.get('commit', 'unknown')
             command = payload.get('command', '')
             
             if not command:
-                logger.warning(f"{client_ip} - Missing command in request")
-                self.send_response(400)
-                self.send_header('Content-Type', CONTENT_TYPE_JSON)
-                self.end_headers()
-                self.wfile.write(json.dumps({'error': 'Missing command in request'}).encode())
+                logger.warning("%s - Missing command in request", client_ip)
+                self.respond(400, _ERR_MISSING_COMMAND)
                 return
             
             validation_result = self.validate_command(command)
             if not validation_result['valid']:
-                logger.warning(f"{client_ip} - Invalid command rejected: {validation_result['reason']}")
-                self.send_response(400)
-                self.send_header('Content-Type', CONTENT_TYPE_JSON)
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                logger.warning("%s - Invalid command rejected: %s", client_ip, validation_result['reason'])
+                self.respond(400, _json_dumps({
                     'error': 'Invalid command',
                     'reason': validation_result['reason']
-                }).encode())
+                }))
                 return
             
-            logger.info(f"{client_ip} - Deployment request received for commit: {commit}, command: {command[:100]}")
+            logger.info("%s - Deployment request received for commit: %s, command: %s", client_ip, commit, command[:100])
             
-            result = self.execute_deployment(commit, command)
+            result = self.execute_deployment(commit, validation_result['steps'])
             
             if result['success']:
-                self.send_response(200)
-                self.send_header('Content-Type', CONTENT_TYPE_JSON)
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                self.respond(200, _json_dumps({
                     'status': 'success',
                     'message': 'Deployment completed',
                     'commit': commit,
-                    'output': result.get('output', '')
-                }).encode())
-                logger.info(f"{client_ip} - Deployment successful for commit: {commit}")
+                    'output': result.get('output', ''),
+                    'log_id': result.get('log_id'),
+                }))
+                logger.info("%s - Deployment successful for commit: %s", client_ip, commit)
             else:
-                self.send_response(500)
-                self.send_header('Content-Type', CONTENT_TYPE_JSON)
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                self.respond(500, _json_dumps({
                     'status': 'error',
                     'message': 'Deployment failed',
                     'commit': commit,
-                    'error': result.get('error', '')
-                }).encode())
-                logger.error(f"{client_ip} - Deployment failed for commit: {commit}: {result.get('error', '')}")
+                    'error': result.get('error', ''),
+                    'log_id': result.get('log_id'),
+                }))
+                logger.error("%s - Deployment failed for commit: %s: %s", client_ip, commit, result.get('error', ''))
         
         except json.JSONDecodeError:
-            logger.error(f"{client_ip} - Invalid JSON payload")
-            self.send_response(400)
-            self.send_header('Content-Type', CONTENT_TYPE_JSON)
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': 'Invalid JSON'}).encode())
+            logger.error("%s - Invalid JSON payload", client_ip)
+            self.respond(400, _ERR_INVALID_JSON)
         except Exception as e:
-            logger.error(f"{client_ip} - Unexpected error: {str(e)}")
-            self.send_response(500)
-            self.send_header('Content-Type', CONTENT_TYPE_JSON)
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': 'Internal server error'}).encode())
+            logger.error("%s - Unexpected error: %s", client_ip, e)
+            self.respond(500, _ERR_INTERNAL)
+
+    def authorize(self, content_length=0):
+        client_ip = self.client_address[0]
+        
+        auth_header = self.headers.get('Authorization', '')
+        if len(auth_header) < 8 or auth_header[:7] != 'Bearer ':
+            logger.warning("%s - Missing or invalid Authorization header", client_ip)
+            self.discard_body(content_length)
+            self.respond(401, _ERR_UNAUTHORIZED)
+            return False
+        
+        token = auth_header[7:]
+        
+        if not self.validate_token(token):
+            logger.warning("%s - Invalid token", client_ip)
+            self.discard_body(content_length)
+            self.respond(401, _ERR_INVALID_TOKEN)
+            return False
+        
+        return True
+
+    def content_length(self):
+        values = self.headers.get_all('Content-Length')
+        if not values:
+            return 0
+        value = values[0].strip()
+        if len(values) > 1 and any(v.strip() != value for v in values):
+            return None
+        if not (value.isascii() and value.isdigit()):
+            return None
+        return int(value)
+
+    def discard_body(self, content_length):
+        remaining = content_length
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, BODY_CHUNK_SIZE))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+
+    def read_body(self, content_length):
+        chunks = []
+        remaining = content_length
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, BODY_CHUNK_SIZE))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
 
     def validate_token(self, token):
-        expected_token = DEPLOY_WEBHOOK_SECRET
-        return hmac.compare_digest(token, expected_token)
+        token = token.encode()
+        padded = (token + b'\x00' * _EXPECTED_TOKEN_LEN)[:_EXPECTED_TOKEN_LEN]
+        return hmac.compare_digest(padded, _EXPECTED_TOKEN) and len(token) == _EXPECTED_TOKEN_LEN
 
     def validate_command(self, command):
         command = command.strip()
@@ -180,82 +365,114 @@ class DeploymentHandler(BaseHTTPRequestHandler):
         if not command:
             return {'valid': False, 'reason': 'Empty command'}
         
-        for pattern in BLOCKED_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                return {'valid': False, 'reason': f'Blocked dangerous pattern: {pattern}'}
+        match = _BLOCKED_RE.search(command.encode('utf-8', 'surrogatepass'))
+        if match:
+            pattern = match.group(0).decode('utf-8', errors='replace')
+            return {'valid': False, 'reason': f'Blocked dangerous pattern: {pattern!r}'}
         
-        commands = re.split(r'\s*&&\s*|\s*;\s*', command)
-        has_allowed = False
+        commands = [cmd for cmd in _SPLIT_RE.split(command) if cmd]
+        steps = []
         
         for cmd in commands:
-            cmd = cmd.strip()
-            if not cmd:
-                continue
+            verb = _ARG_SPLIT_RE.split(cmd, 1)[0].lower()
+            if verb not in _ALLOWED_VERBS:
+                return {'valid': False, 'reason': f'Command not in whitelist: {cmd[:50]}'}
             
-            is_allowed = False
-            for allowed_pattern in ALLOWED_COMMANDS:
-                if re.match(allowed_pattern, cmd, re.IGNORECASE):
-                    is_allowed = True
-                    has_allowed = True
-                    break
+            try:
+                argv = split_args(cmd)
+            except ValueError:
+                return {'valid': False, 'reason': f'Malformed command: {cmd[:50]}'}
             
-            if not is_allowed:
+            if len(argv) < 2:
                 return {'valid': False, 'reason': f'Command not in whitelist: {cmd[:50]}'}
+            if verb == 'cd' and len(argv) != 2:
+                return {'valid': False, 'reason': f'cd expects a single directory: {cmd[:50]}'}
+            
+            argv[0] = verb
+            steps.append(argv)
         
-        if not has_allowed:
+        if not steps:
             return {'valid': False, 'reason': 'No allowed commands found'}
         
-        return {'valid': True}
+        return {'valid': True, 'steps': steps}
 
-    def execute_deployment(self, commit, command):
-        logger.info(f"Starting deployment for commit: {commit}")
-        try:
-            result = self.run_deploy_command(command)
-            if result['success']:
-                logger.info(f"Deployment completed successfully for commit: {commit}")
-            return result
-        
-        except Exception as e:
-            logger.error(f"Deployment error for commit {commit}: {str(e)}")
-            return {'success': False, 'error': str(e)}
+    def execute_deployment(self, commit, steps):
+        with _deploy_lock:
+            logger.info("Starting deployment for commit: %s", commit)
+            try:
+                os.makedirs(DEPLOY_LOG_DIR, exist_ok=True)
+                log_id = f"{_UNSAFE_LOG_ID_CHARS.sub('_', str(commit))[:64]}-{time.time_ns()}"
+                with open(log_path(log_id), 'ab+', buffering=0) as log_file:
+                    result = self.run_deploy_command(steps, log_file)
+                result['log_id'] = log_id
+                if result['success']:
+                    logger.info("Deployment completed successfully for commit: %s", commit)
+                return result
+            
+            except Exception as e:
+                logger.error("Deployment error for commit %s: %s", commit, e)
+                return {'success': False, 'error': str(e)}
 
-    def run_deploy_command(self, command):
+    def run_deploy_command(self, steps, log_file):
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        cwd = os.getcwd()
+        
         try:
-            logger.info(f"Executing command: {command}")
-            
-            process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=os.setsid
-            )
-            
-            try:
-                stdout, stderr = process.communicate(timeout=COMMAND_TIMEOUT)
-                if process.returncode == 0:
-                    output = stdout.decode('utf-8', errors='ignore')
-                    logger.info(f"Deployment command successful: {output[:200]}")
-                    return {'success': True, 'output': output}
-                else:
-                    error = stderr.decode('utf-8', errors='ignore')
-                    logger.error(f"Deployment command failed: {error}")
+            for argv in steps:
+                log_file.write(f"$ {shlex.join(argv)}\n".encode())
+                
+                if argv[0] == 'cd':
+                    cwd = os.path.join(cwd, os.path.expanduser(argv[1]))
+                    if not os.path.isdir(cwd):
+                        error = f'cd: {argv[1]}: No such directory'
+                        log_file.write(f"{error}\n".encode())
+                        logger.error("Deployment command failed: %s", error)
+                        return {'success': False, 'error': f'Deployment failed: {error}'}
+                    continue
+                
+                logger.info("Executing command: %s (cwd: %s)", shlex.join(argv), cwd)
+                
+                process = subprocess.Popen(
+                    argv,
+                    cwd=cwd,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True
+                )
+                
+                try:
+                    process.wait(timeout=max(0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                    logger.error("Deployment command timed out after %s seconds", COMMAND_TIMEOUT)
+                    return {'success': False, 'error': f'Deployment timed out after {COMMAND_TIMEOUT} seconds'}
+                
+                if process.returncode != 0:
+                    error = self.read_log_tail(log_file)
+                    logger.error("Deployment command failed: %s", error)
                     return {'success': False, 'error': f'Deployment failed: {error}'}
-            except subprocess.TimeoutExpired:
-                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                logger.error(f"Deployment command timed out after {COMMAND_TIMEOUT} seconds")
-                return {'success': False, 'error': f'Deployment timed out after {COMMAND_TIMEOUT} seconds'}
+            
+            output = self.read_log_tail(log_file)
+            logger.info("Deployment command successful: %s", output[:200])
+            return {'success': True, 'output': output}
         
         except Exception as e:
-            logger.error(f"Error running deployment command: {str(e)}")
+            logger.error("Error running deployment command: %s", e)
             return {'success': False, 'error': f'Deployment error: {str(e)}'}
 
+    def read_log_tail(self, log_file):
+        fd = log_file.fileno()
+        size = os.fstat(fd).st_size
+        tail = os.pread(fd, LOG_TAIL_SIZE, max(0, size - LOG_TAIL_SIZE))
+        return tail.decode('utf-8', errors='ignore')
+
 def main():
-    logger.info(f"Starting deployment webhook service on port {PORT}")
-    logger.info(f"COMMAND_TIMEOUT: {COMMAND_TIMEOUT}s")
+    logger.info("Starting deployment webhook service on port %s", PORT)
+    logger.info("COMMAND_TIMEOUT: %ss", COMMAND_TIMEOUT)
+    logger.info("DEPLOY_LOG_DIR: %s", DEPLOY_LOG_DIR)
     logger.info("Commands accepted from request payload (include cd for directory changes)")
     
-    server = HTTPServer(('0.0.0.0', PORT), DeploymentHandler)
+    server = ThreadingHTTPServer(('0.0.0.0', PORT), DeploymentHandler)
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -0,0 +1,50 @@
+import http.client
+import importlib.util
+import logging
+import os
+import socket
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+os.environ.setdefault('DEPLOY_WEBHOOK_SECRET', 'test-secret')
+
+_SPEC = importlib.util.spec_from_file_location(
+    'deployment_service', Path(__file__).resolve().parent.parent / 'deployment-service.py'
+)
+deployment_service = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(deployment_service)
+deployment_service.logger.setLevel(logging.CRITICAL)
+
+AUTH = {'Authorization': f'Bearer {deployment_service.DEPLOY_WEBHOOK_SECRET}'}
+
+
+class LiveServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), deployment_service.DeploymentHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def exchange(self, request):
+        with socket.create_connection(self.server.server_address, timeout=5) as sock:
+            sock.sendall(request)
+            data = b''
+            while chunk := sock.recv(65536):
+                data += chunk
+        return data
+
+    def request(self, method, path, body=None, headers=None):
+        connection = http.client.HTTPConnection(*self.server.server_address, timeout=30)
+        try:
+            connection.request(method, path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, response.read()
+        finally:
+            connection.close()
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from support import AUTH, LiveServerTestCase, deployment_service
+
+
+class DeploymentLogsTest(LiveServerTestCase):
+    def setUp(self):
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.log_dir.cleanup)
+        patcher = mock.patch.object(deployment_service, 'DEPLOY_LOG_DIR', self.log_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def deploy(self, commit, command='git --version'):
+        status, body = self.request(
+            'POST', '/deploy', json.dumps({'commit': commit, 'command': command}).encode(), AUTH
+        )
+        self.assertEqual(status, 200, body)
+        return json.loads(body)
+
+    def test_logs_require_token(self):
+        for headers in ({}, {'Authorization': 'Bearer wrong'}):
+            with self.subTest(headers=headers):
+                status, _ = self.request('GET', '/logs/anything', headers=headers)
+                self.assertEqual(status, 401)
+
+    def test_invalid_log_ids_are_not_found(self):
+        open(os.path.join(self.log_dir.name, 'x.log'), 'w').close()
+        for log_id in ('../x', 'a/b', 'a' * 129, 'x.log', 'missing'):
+            with self.subTest(log_id=log_id):
+                status, body = self.request('GET', '/logs/' + log_id, headers=AUTH)
+                self.assertEqual(status, 404)
+                self.assertEqual(body, deployment_service._ERR_LOG_NOT_FOUND)
+
+    def test_log_matches_deployment_output(self):
+        result = self.deploy('abc123')
+        path = os.path.join(self.log_dir.name, result['log_id'] + '.log')
+        with open(path, 'rb') as log_file:
+            contents = log_file.read()
+        self.assertIn(b'$ git --version\ngit version ', contents)
+        self.assertEqual(result['output'].encode(), contents)
+
+        status, body = self.request('GET', '/logs/' + result['log_id'], headers=AUTH)
+        self.assertEqual(status, 200)
+        self.assertEqual(body, contents)
+
+    def test_output_is_capped_at_log_tail_size(self):
+        with tempfile.TemporaryFile() as log_file:
+            log_file.write(b'x' * (3 * deployment_service.LOG_TAIL_SIZE) + b'last line\n')
+            tail = deployment_service.DeploymentHandler.read_log_tail(None, log_file)
+        self.assertEqual(len(tail), deployment_service.LOG_TAIL_SIZE)
+        self.assertTrue(tail.endswith('last line\n'))
+
+        with mock.patch.object(deployment_service, 'LOG_TAIL_SIZE', 16):
+            result = self.deploy('capped')
+        with open(os.path.join(self.log_dir.name, result['log_id'] + '.log'), 'rb') as log_file:
+            contents = log_file.read()
+        self.assertGreater(len(contents), 16)
+        self.assertEqual(result['output'].encode(), contents[-16:])
+
+    def test_commit_is_sanitised_in_file_name(self):
+        for commit in ('../../etc', 'a/b c\x00d', 'x' * 200):
+            with self.subTest(commit=commit):
+                log_id = self.deploy(commit)['log_id']
+                self.assertRegex(log_id, r'\A[A-Za-z0-9_-]{1,128}\Z')
+                self.assertTrue(log_id.startswith(
+                    deployment_service._UNSAFE_LOG_ID_CHARS.sub('_', commit)[:64] + '-'
+                ))
+                self.assertIn(log_id + '.log', os.listdir(self.log_dir.name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import socket
+import unittest
+
+from support import LiveServerTestCase
+
+SMUGGLED = b'GET /health HTTP/1.1\r\nHost: x\r\n\r\n'
+
+
+class RequestFramingTest(LiveServerTestCase):
+    def assert_single_closed_response(self, response, status):
+        self.assertTrue(response.startswith(b'HTTP/1.1 %d ' % status), response)
+        self.assertIn(b'\r\nConnection: close\r\n', response)
+        self.assertEqual(response.count(b'HTTP/1.1 '), 1, response)
+
+    def test_transfer_encoding_is_rejected(self):
+        body = b'2\r\n{}\r\n0\r\n\r\n'
+        response = self.exchange(
+            b'POST /deploy HTTP/1.1\r\nHost: x\r\nAuthorization: Bearer test-secret\r\n'
+            b'Transfer-Encoding: chunked\r\n\r\n' + body + SMUGGLED
+        )
+        self.assert_single_closed_response(response, 411)
+
+    def test_invalid_content_length_is_rejected(self):
+        for value in (b'1x', b'-5', b'+5', b'1_0'):
+            with self.subTest(value=value):
+                response = self.exchange(
+                    b'POST /deploy HTTP/1.1\r\nHost: x\r\nContent-Length: ' + value
+                    + b'\r\n\r\n' + SMUGGLED
+                )
+                self.assert_single_closed_response(response, 400)
+
+    def test_conflicting_content_lengths_are_rejected(self):
+        response = self.exchange(
+            b'POST /deploy HTTP/1.1\r\nHost: x\r\nContent-Length: 0\r\nContent-Length: 34\r\n\r\n'
+            + SMUGGLED
+        )
+        self.assert_single_closed_response(response, 400)
+
+    def test_get_with_body_closes_connection(self):
+        response = self.exchange(
+            b'GET /health HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n' % len(SMUGGLED)
+            + SMUGGLED
+        )
+        self.assert_single_closed_response(response, 200)
+
+    def test_keep_alive_without_body(self):
+        with socket.create_connection(self.server.server_address, timeout=5) as sock:
+            sock.sendall(SMUGGLED + SMUGGLED)
+            data = b''
+            while data.count(b'HTTP/1.1 200 ') < 2:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        self.assertEqual(data.count(b'HTTP/1.1 200 '), 2, data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from support import deployment_service
+
+_HANDLER = deployment_service.DeploymentHandler.__new__(deployment_service.DeploymentHandler)
+
+
+class RunDeployCommandTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.log_file = tempfile.TemporaryFile(buffering=0)
+        self.addCleanup(self.log_file.close)
+
+    def run_steps(self, steps):
+        result = _HANDLER.run_deploy_command(steps, self.log_file)
+        self.log_file.seek(0)
+        return result, self.log_file.read().decode()
+
+    def test_cd_changes_directory_for_following_steps(self):
+        result, log = self.run_steps([['cd', self.tmpdir.name], ['git', '--version'], ['git', 'init', '-q', 'repo']])
+        self.assertTrue(result['success'], result)
+        self.assertIn(f'$ cd {self.tmpdir.name}\n$ git --version\ngit version ', log)
+        self.assertTrue(os.path.isdir(os.path.join(self.tmpdir.name, 'repo', '.git')))
+
+    def test_relative_cd_is_resolved_against_previous_cd(self):
+        os.mkdir(os.path.join(self.tmpdir.name, 'app'))
+        result, _ = self.run_steps([['cd', self.tmpdir.name], ['cd', 'app'], ['git', 'init', '-q']])
+        self.assertTrue(result['success'], result)
+        self.assertTrue(os.path.isdir(os.path.join(self.tmpdir.name, 'app', '.git')))
+
+    def test_missing_directory_fails_without_spawning(self):
+        with mock.patch.object(deployment_service.subprocess, 'Popen') as popen:
+            result, log = self.run_steps([['cd', '/nonexistent'], ['git', 'status']])
+        popen.assert_not_called()
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], 'Deployment failed: cd: /nonexistent: No such directory')
+        self.assertEqual(log, '$ cd /nonexistent\ncd: /nonexistent: No such directory\n')
+
+    def test_stops_at_first_failed_step(self):
+        result, log = self.run_steps([['cd', self.tmpdir.name], ['git', 'status'], ['git', 'init', '-q']])
+        self.assertFalse(result['success'])
+        self.assertIn('not a git repository', result['error'])
+        self.assertNotIn('$ git init', log)
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, '.git')))
+
+    def test_timeout_is_shared_across_steps(self):
+        with mock.patch.object(deployment_service, 'COMMAND_TIMEOUT', 1):
+            start = time.monotonic()
+            result, log = self.run_steps([['sleep', '0.7'], ['sleep', '0.7'], ['git', '--version']])
+            elapsed = time.monotonic() - start
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], 'Deployment timed out after 1 seconds')
+        self.assertNotIn('$ git --version', log)
+        self.assertLess(elapsed, 1.3)
+
+    def test_cd_with_several_arguments_is_rejected(self):
+        for command in ('cd a b && git pull', 'cd "/srv/a" /tmp; git pull'):
+            with self.subTest(command=command):
+                result = deployment_service.DeploymentHandler.validate_command(None, command)
+                self.assertFalse(result['valid'])
+                self.assertIn('cd expects a single directory', result['reason'])
+
+
+if __name__ == '__main__':
+    unittest.main()
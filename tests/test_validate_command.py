@@ -0,0 +1,114 @@
+import re
+import time
+import unittest
+
+from support import deployment_service
+
+
+def validate(command):
+    return deployment_service.DeploymentHandler.validate_command(None, command)
+
+
+def best_time(command, runs=5):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        validate(command)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class ValidateCommandTest(unittest.TestCase):
+    def test_allowed_command_is_split_into_steps(self):
+        result = validate('cd /var/www/app && git pull origin master && docker compose up -d --build')
+        self.assertTrue(result['valid'])
+        self.assertEqual(result['steps'], [
+            ['cd', '/var/www/app'],
+            ['git', 'pull', 'origin', 'master'],
+            ['docker', 'compose', 'up', '-d', '--build'],
+        ])
+
+    def test_quoted_arguments(self):
+        result = validate('cd "/srv/my app" && git commit -m \'deploy fix\'')
+        self.assertEqual(result['steps'], [['cd', '/srv/my app'], ['git', 'commit', '-m', 'deploy fix']])
+
+    def test_whitespace_around_separators(self):
+        for command in ('git status ;\n; git --version', 'git status\r\n&&\tgit --version', 'git status;;git --version'):
+            with self.subTest(command=command):
+                result = validate(command)
+                self.assertTrue(result['valid'], result.get('reason'))
+                self.assertEqual(result['steps'], [['git', 'status'], ['git', '--version']])
+
+    def test_blocked_patterns(self):
+        for command in ('rm -rf /', 'git pull | sh', 'git pull && rm x', 'cd x; RM -R y', 'git x>/dev/sda', 'git x>a >/dev/sda'):
+            with self.subTest(command=command):
+                result = validate(command)
+                self.assertFalse(result['valid'])
+                self.assertIn('Blocked dangerous pattern', result['reason'])
+
+    def test_commands_outside_whitelist(self):
+        for command in ('ls', 'git', 'cd /x && ls', 'echo hi', '"git" pull'):
+            with self.subTest(command=command):
+                self.assertFalse(validate(command)['valid'])
+
+    def test_unbalanced_quotes_are_rejected(self):
+        self.assertIn('Malformed command', validate('git commit -m "oops')['reason'])
+
+
+class CompileAlternationTest(unittest.TestCase):
+    PATTERN_SETS = (
+        deployment_service.BLOCKED_PATTERNS,
+        [r'\brm\s', r'x?curl'],
+        [r'\brm\s', r'u{0,1}wget'],
+        [r'\brm\s', r'w*get'],
+        [r'\brm\s', r'curl|wget'],
+        [r'\brm\s', r'(?:a|b)c', r'[|]x'],
+    )
+    INPUTS = (
+        'git curl', 'git wget', 'git get', 'git rm x', 'git bc', 'git |x', 'git \\',
+        'git pull', 'git x>/dev/sda', 'git x>a >/dev/sda', 'git pull | sh',
+    )
+
+    def test_fused_regex_matches_naive_alternation(self):
+        for patterns in self.PATTERN_SETS:
+            fused = deployment_service._compile_alternation(patterns)
+            naive = re.compile('|'.join(patterns).encode(), re.IGNORECASE | re.ASCII)
+            for command in self.INPUTS:
+                with self.subTest(patterns=patterns, command=command):
+                    self.assertEqual(bool(fused.search(command.encode())), bool(naive.search(command.encode())))
+
+    def test_unsafe_leads_are_not_guarded(self):
+        for pattern in (r'x?curl', r'u{0,1}wget', r'w*get', r'curl|wget', r'(?:a|b)c', '\\', r'\b\\'):
+            with self.subTest(pattern=pattern):
+                self.assertIsNone(deployment_service._leading_literal(pattern))
+        self.assertEqual(deployment_service._leading_literal(r'\brm\s{1,8}-rf'), 'r')
+        self.assertEqual(deployment_service._leading_literal(r'\|[ \t]{0,8}sh'), '\\|')
+
+
+class ValidateCommandPerformanceTest(unittest.TestCase):
+    # Commands are capped by MAX_BODY (64 KB), so 50 KB inputs are close to
+    # the worst case a client can send.
+    def test_long_unallowed_command(self):
+        self.assertLess(best_time('a' * 50000), 0.010)
+
+    def test_adversarial_inputs(self):
+        for command in (
+            'a>' * 25000,
+            'git ' + 'a>' * 25000,
+            'git ' + 'a' * 50000,
+            'git |' + ' ' * 50000 + 'x',
+            'git' + ' ;' * 25000,
+            'git x' + ' \n' * 25000 + 'y',
+            'git ' + 'rm' * 25000,
+        ):
+            with self.subTest(command=command[:12]):
+                self.assertLess(best_time(command), 0.050)
+
+    def test_quoted_input(self):
+        # Quoted arguments are parsed by shlex, which is linear but slow per
+        # character.
+        self.assertLess(best_time('git "' + 'a' * 50000 + '"'), 0.250)
+
+
+if __name__ == '__main__':
+    unittest.main()